@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 class AmharicNERLabeler:
@@ -11,24 +12,28 @@ class AmharicNERLabeler:
     -----------
     price_keywords : list
         Keywords associated with price entities.
-    location_list : list
-        Predefined list of known location keywords.
-    product_keywords : list
-        Predefined list of known product keywords.
+    location_list : frozenset
+        Predefined set of known location keywords.
+    product_keywords : frozenset
+        Predefined set of known product keywords.
     """
 
+    # Decodes the integer label codes used by `label_dataframe`
+    _label_names = np.array(['O', 'I-PRICE', 'B-PRICE', 'B-LOCATION', 'B-PRODUCT'], dtype=object)
+
     def __init__(self):
         # Define keywords for different entities
         self.price_keywords = ['ዋጋ', 'ብር', 'ከ']
-        self.location_list = [
+        # Stored as frozensets so membership checks are hashed lookups
+        self.location_list = frozenset([
             'አዲስ', 'የታይላንድ', 'ቦሌ', 'ቡልጋሪ', 
             'በረራ', 'ልደታ', 'ባልቻ', 'አአ'
-        ]
-        self.product_keywords = [
+        ])
+        self.product_keywords = frozenset([
             'ምርት', 'ስቶቭ', 'ማንኪያ', 'የችበስመጥበሻ',
             'መጥበሻ', 'መጥበሻዎች', 'ምርቶች', 'ባትራ', 'ካርድ','መፍጫ',
             'መወልወያ','መደርደሪያ','መስታወት','እንጨት','ሶፋ','ኩርሲ'
-        ]
+        ])
 
     def label_tokens(self, tokens):
         """
@@ -44,6 +49,9 @@ class AmharicNERLabeler:
         list
             A list of tuples where each tuple contains a token and its corresponding label.
         """
+        # `label_dataframe` implements the same rules as array operations. Any
+        # change to them must be mirrored there;
+        # test_label_dataframe_matches_label_tokens checks that the two agree.
         labels = []
 
         for i, token in enumerate(tokens):
@@ -130,7 +138,75 @@ class AmharicNERLabeler:
         pandas.DataFrame
             A DataFrame with tokens and their corresponding NER labels.
         """
-        df['Labeled'] = df[token_column].apply(self.label_tokens)
+        # Flatten every message into one array of tokens so that the rules
+        # from `label_tokens` run as array operations instead of a Python
+        # loop per token. `row_ids` remembers which message a token came from.
+        token_lists = df[token_column].reset_index(drop=True)
+        # Empty (or missing) lists would explode to a NaN placeholder, so only
+        # messages with tokens are exploded. Missing tokens inside a list are
+        # kept, as they still separate their neighbours.
+        exploded = token_lists[token_lists.str.len() > 0].explode()
+        row_ids = exploded.index.to_numpy()
+        tokens = exploded.to_list()
+
+        # Evaluate the per-token checks once per distinct token and broadcast
+        # the results back with the factorized codes. Missing tokens get a
+        # vocab entry of their own, which matches no rule and is labeled 'O'.
+        codes, vocab = pd.factorize(exploded, use_na_sentinel=False)
+        vocab = pd.Series(vocab, dtype=object).str.strip()
+        has_price = vocab.str.contains('ዋጋ', regex=False, na=False).to_numpy()
+        has_birr = vocab.str.contains('ብር', regex=False, na=False).to_numpy()
+        has_from = vocab.str.contains('ከ', regex=False, na=False).to_numpy()
+        price_with_digit = has_price.copy()
+        price_with_digit[has_price] = [
+            any(char.isdigit() for char in token) for token in vocab[has_price]
+        ]
+
+        # Label every distinct token with the context-free steps of
+        # `label_tokens` as small integer codes (same precedence: first match
+        # wins). Numbers are the only tokens whose label depends on their
+        # neighbours, so they get a placeholder code resolved per position.
+        O, I_PRICE, B_PRICE, B_LOCATION, B_PRODUCT, NUMBER = range(6)
+        vocab_codes = np.select(
+            [
+                vocab.str.endswith('ብር', na=False).to_numpy(),
+                vocab.eq('ዋጋ').to_numpy(),
+                vocab.str.isdigit().eq(True).to_numpy(),
+                has_price & has_birr,
+                has_from & has_birr,
+                price_with_digit,
+                vocab.isin(self.location_list).to_numpy(),
+                vocab.isin(self.product_keywords).to_numpy(),
+            ],
+            [I_PRICE, B_PRICE, NUMBER, I_PRICE, I_PRICE, I_PRICE, B_LOCATION, B_PRODUCT],
+            default=O,
+        ).astype(np.int8)
+        token_codes = vocab_codes[codes]
+
+        # A number is a price when followed by "ብር" or preceded by "ዋጋ" in the
+        # same message
+        is_birr = vocab.eq('ብር').to_numpy()[codes]
+        is_price_word = vocab.eq('ዋጋ').to_numpy()[codes]
+        same_message = row_ids[1:] == row_ids[:-1]
+        next_is_birr = np.zeros(len(tokens), dtype=bool)
+        next_is_birr[:-1] = is_birr[1:] & same_message
+        prev_is_price = np.zeros(len(tokens), dtype=bool)
+        prev_is_price[1:] = is_price_word[:-1] & same_message
+
+        is_number = token_codes == NUMBER
+        token_codes[is_number] = np.where(
+            (next_is_birr | prev_is_price)[is_number], I_PRICE, O
+        )
+        labels = self._label_names[token_codes].tolist()
+
+        # Tokens of a message are contiguous after `explode`, so the pairs can
+        # be sliced back into one list per message using the message lengths
+        pairs = list(zip(tokens, labels))
+        lengths = np.bincount(row_ids, minlength=len(df))
+        ends = lengths.cumsum()
+        starts = ends - lengths
+        labeled = [pairs[start:end] for start, end in zip(starts.tolist(), ends.tolist())]
+        df['Labeled'] = pd.Series(labeled, index=df.index, dtype=object)
         return df
     
     def save_conll_format(self, labeled_data, file_path):
@@ -144,8 +220,11 @@ class AmharicNERLabeler:
         file_path : str
             The path to the file where the CoNLL format will be saved.
         """
-        with open(file_path, 'w', encoding='utf-8') as f:
-            for _, row in labeled_data.iterrows():
-                for token, label in row['Labeled']:
-                    f.write(f"{token} {label}\n")
-                f.write("\n")  # Blank line between sentences/messages
+        # Format each message as one block instead of one write per token;
+        # every block ends with a blank line separating sentences/messages
+        blocks = [
+            "".join(f"{token} {label}\n" for token, label in labeled) + "\n"
+            for labeled in labeled_data['Labeled'].to_numpy()
+        ]
+        with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(blocks)
@@ -1,31 +1,147 @@
 import re
+from multiprocessing import Pool
 import numpy as np
 import pandas as pd
+from pandas.api.extensions import take
 
 class AmharicTextPreprocessor:
-    def __init__(self):
-        # Allow Amharic letters, numbers, spaces, and the '/' character
-        self.allowed_characters = re.compile(r'[^ሀ-ፐ0-9\s/]')  # Exclude English letters
-        # self.price_pattern = re.compile(
-        #     r'(መሸጫ\s*(?:[።፡.-]?\s*)?ዋጋ\s*\d+ብር|መሸጫ\s*\d+\s*ብር|መሸጫ\s*ብር\s*\d+|መሸጫ\s*\d+|(ዋጋ|በ)\s*\d+\s*ብር|\d+\s*ብር|(?:\d+ብር))'
-        # )
+    # Allow Amharic letters, numbers, spaces, and the '/' character.
+    # Compiled once at import and shared by all instances.
+    allowed_characters = re.compile(r'[^ሀ-ፐ0-9\s/]')
+    # The non-whitespace characters kept above; text without any of them
+    # normalizes to nothing
+    content_characters = re.compile('[ሀ-ፐ0-9/]')
 
     def normalize_text(self, text):
         if not isinstance(text, str) or not text.strip():
             return np.nan
 
-        # Remove unwanted characters but keep specific patterns intact
-        text = re.sub(self.allowed_characters, '', text)  # Remove unwanted characters
-        text = re.sub(r'\s+', ' ', text).strip()  # Remove extra spaces and newlines
+        return ' '.join(self._filter_and_split(text))
 
-        return text
+    def _filter_and_split(self, text):
+        # Remove unwanted characters in a single regex pass, then collapse
+        # spaces/newlines with str.split instead of a second regex pass
+        return self.allowed_characters.sub('', text).split()
+
+    def tokenize_text(self, text):
+        if not isinstance(text, str):
+            return np.nan
+
+        # Normalized text is already single-space separated, so a plain split
+        # is enough; no sentence/word tokenizer models are needed
+        return text.split()
 
     def preprocess(self, text):
         normalized_text = self.normalize_text(text)
         return normalized_text if normalized_text and normalized_text != '' else np.nan
 
-    def preprocess_dataframe(self, df, text_column):
-        # Apply preprocessing to the specified text column only
-        df['preprocessed_message'] = df[text_column].apply(self.preprocess)
+    def preprocess_tokens(self, text):
+        # Normalize and tokenize in one pass, without building and re-splitting
+        # the intermediate normalized string
+        if not isinstance(text, str):
+            return np.nan
+
+        tokens = self._filter_and_split(text)
+        return tokens if tokens else np.nan
+
+    def _preprocess_series(self, text, tokenize=False):
+        # `preprocess`, or `preprocess_tokens` when tokenizing, over a Series
+        # of messages. Returns the normalized text and the tokens (or None).
+        # Messages without any content character (e.g. English or emoji only)
+        # are recognised by one search and skip the filter entirely.
+        index = text.index
+        text = [
+            value if isinstance(value, str) and self.content_characters.search(value) else np.nan
+            for value in text
+        ]
+        if not tokenize:
+            normalized = pd.Series([self.preprocess(value) for value in text], index=index, dtype=object)
+            return normalized, None
+
+        # The normalized text is joined from the tokens, so each message is
+        # filtered only once
+        tokens = pd.Series(
+            [self.preprocess_tokens(value) for value in text], index=index, dtype=object
+        )
+        normalized = pd.Series(
+            [' '.join(value) if isinstance(value, list) else np.nan for value in tokens],
+            index=index, dtype=object,
+        )
+        return normalized, tokens
+
+    def preprocess_dataframe(self, df, text_column, tokenize=False, n_jobs=1, pool=None):
+        # Apply preprocessing to the specified text column only. Scraped
+        # channels repeat (forwarded) messages a lot, so each distinct message
+        # is processed once and the results are broadcast back by code.
+        # `pool` is a running multiprocessing Pool to use when n_jobs > 1,
+        # instead of starting one for this call.
+        codes, uniques = pd.factorize(df[text_column].to_numpy(dtype=object))
+        uniques = pd.Series(uniques, dtype=object)
+
+        if n_jobs > 1 and len(uniques) > n_jobs:
+            # Messages are independent, so shard them across worker processes
+            bounds = np.linspace(0, len(uniques), n_jobs + 1).astype(int)
+            chunks = [uniques.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+            args = [(chunk, tokenize) for chunk in chunks]
+            if pool is None:
+                with Pool(n_jobs) as pool:
+                    results = pool.starmap(self._preprocess_series, args)
+            else:
+                results = pool.starmap(self._preprocess_series, args)
+            normalized = pd.concat([result[0] for result in results])
+            tokens = pd.concat([result[1] for result in results]) if tokenize else None
+        else:
+            normalized, tokens = self._preprocess_series(uniques, tokenize)
+
+        df['preprocessed_message'] = take(
+            normalized.to_numpy(), codes, allow_fill=True, fill_value=np.nan
+        )
+        if tokenize:
+            # Repeats of a message get their own copy of the token list, so
+            # rows with the same message cannot mutate each other's tokens
+            tokens = take(tokens.to_numpy(), codes, allow_fill=True, fill_value=np.nan)
+            repeated = pd.Series(codes).duplicated().to_numpy()
+            df['tokenized_message'] = pd.Series(
+                [list(value) if is_repeat and isinstance(value, list) else value
+                 for value, is_repeat in zip(tokens, repeated)],
+                index=df.index, dtype=object,
+            )
         return df
 
+    def preprocess_file(self, input_path, output_path, text_column, chunksize=100_000,
+                        tokenize=False, n_jobs=1, dtype=None):
+        # Stream a large CSV through `preprocess_dataframe` chunk by chunk and
+        # append each chunk to a Parquet file, so memory stays bounded by the
+        # chunk size rather than the corpus size. The text column is always
+        # read as text; other column types are inferred unless given in
+        # `dtype` (a mapping passed on to read_csv). The Parquet schema comes
+        # from the first chunk. Columns that are empty there, and not listed
+        # in `dtype`, are stored as strings, so a column that is empty at
+        # first but numeric later must be listed in `dtype`. With n_jobs > 1
+        # one worker pool serves every chunk. pyarrow is only needed here, so
+        # it is not imported with the module.
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        dtype = {**(dtype or {}), text_column: str}
+        pool = Pool(n_jobs) if n_jobs > 1 else None
+        writer = None
+        try:
+            with pd.read_csv(input_path, chunksize=chunksize, dtype=dtype) as reader:
+                for chunk in reader:
+                    chunk = self.preprocess_dataframe(chunk, text_column, tokenize, n_jobs, pool)
+                    if writer is None:
+                        schema = pa.schema([
+                            pa.field(field.name, pa.list_(pa.string()))
+                            if field.name == 'tokenized_message'
+                            else pa.field(field.name, pa.string())
+                            if field.name not in dtype and chunk[field.name].isna().all() else field
+                            for field in pa.Schema.from_pandas(chunk, preserve_index=False)
+                        ])
+                        writer = pq.ParquetWriter(output_path, schema)
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+        finally:
+            if writer is not None:
+                writer.close()
+            if pool is not None:
+                pool.terminate()
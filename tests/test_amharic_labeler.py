@@ -70,6 +70,35 @@ class TestAmharicNERLabeler(unittest.TestCase):
         labeled_df = self.labeler.label_dataframe(df, 'tokens')
         self.assertEqual(labeled_df['Labeled'].tolist(), expected_output)
 
+    def test_label_dataframe_matches_label_tokens(self):
+        """
+        Test that DataFrame labeling agrees with label_tokens, including
+        price context that must not leak across message boundaries.
+        """
+        messages = [
+            ['ስቶቭ', '300'],
+            ['ብር', 'ዋጋ'],
+            ['1200', 'ብር', 'ከ500ብር'],
+            [],
+            ['ዋጋ5', 'ቦሌ', 'ምርት']
+        ]
+        df = pd.DataFrame({'tokens': messages}, index=[10, 3, 7, 0, 5])
+
+        labeled_df = self.labeler.label_dataframe(df, 'tokens')
+        expected_output = [self.labeler.label_tokens(tokens) for tokens in messages]
+        self.assertEqual(labeled_df['Labeled'].tolist(), expected_output)
+
+    def test_label_dataframe_missing_token(self):
+        """
+        Test that a missing token inside a message is labeled 'O' and still
+        separates a number from the following "ብር".
+        """
+        df = pd.DataFrame({'tokens': [['300', None, 'ብር']]})
+        expected_output = [[('300', 'O'), (None, 'O'), ('ብር', 'I-PRICE')]]
+
+        labeled_df = self.labeler.label_dataframe(df, 'tokens')
+        self.assertEqual(labeled_df['Labeled'].tolist(), expected_output)
+
     def test_save_conll_format(self):
         """
         Test saving the labeled data in CoNLL format.
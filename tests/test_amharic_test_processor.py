@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 import pandas as pd
 import numpy as np
@@ -36,6 +38,13 @@ class TestAmharicTextPreprocessor(unittest.TestCase):
         result = self.preprocessor.normalize_text(text)
         self.assertEqual(result, expected_result)
 
+    def test_normalize_text_unicode_spaces(self):
+        # Test that non-ASCII whitespace still separates words
+        text = "ሰላም\u00a0ዋጋ\u3000300\u2009ብር"
+        expected_result = "ሰላም ዋጋ 300 ብር"
+        result = self.preprocessor.normalize_text(text)
+        self.assertEqual(result, expected_result)
+
     def test_normalize_text_empty_string(self):
         # Test empty string case
         text = ""
@@ -48,6 +57,17 @@ class TestAmharicTextPreprocessor(unittest.TestCase):
         result = self.preprocessor.normalize_text(text)
         self.assertTrue(np.isnan(result))
 
+    def test_tokenize_text(self):
+        # Test tokenizing normalized Amharic text
+        text = self.preprocessor.normalize_text("ሰላም! ዋጋ   300 ብር.")
+        result = self.preprocessor.tokenize_text(text)
+        self.assertEqual(result, ["ሰላም", "ዋጋ", "300", "ብር"])
+
+    def test_tokenize_text_nan_input(self):
+        # Test that missing text stays missing
+        result = self.preprocessor.tokenize_text(np.nan)
+        self.assertTrue(np.isnan(result))
+
     def test_preprocess_dataframe(self):
         # Test processing a DataFrame with Amharic text
         data = {'message': ["ሰላም! ዋጋ 300 ብር.", "በአንድ ዋጋ", ""]}  # One valid, one partial, one empty
@@ -57,5 +77,92 @@ class TestAmharicTextPreprocessor(unittest.TestCase):
         expected_output = pd.Series(["ሰላም ዋጋ 300 ብር", "በአንድ ዋጋ", np.nan], name="preprocessed_message")
         pd.testing.assert_series_equal(processed_df['preprocessed_message'], expected_output)
 
+    def test_preprocess_dataframe_tokenize(self):
+        # Test that tokenizing alongside preprocessing matches the separate steps
+        data = {'message': ["ሰላም! ዋጋ 300 ብር.", "Hello", None]}
+        df = pd.DataFrame(data)
+        processed_df = self.preprocessor.preprocess_dataframe(df, 'message', tokenize=True)
+
+        expected_messages = pd.Series(["ሰላም ዋጋ 300 ብር", np.nan, np.nan], name="preprocessed_message")
+        pd.testing.assert_series_equal(processed_df['preprocessed_message'], expected_messages)
+        self.assertEqual(processed_df['tokenized_message'][0], ["ሰላም", "ዋጋ", "300", "ብር"])
+        self.assertTrue(processed_df['tokenized_message'][1:].isna().all())
+
+    def test_preprocess_dataframe_without_amharic(self):
+        # Test that English/emoji-only rows are empty while numbers are kept
+        data = {'message': ["Hello 😀 !!", "300 / 400", "ዋጋ Hello"]}
+        df = pd.DataFrame(data)
+        processed_df = self.preprocessor.preprocess_dataframe(df, 'message')
+
+        expected_output = pd.Series([np.nan, "300 / 400", "ዋጋ"], name="preprocessed_message")
+        pd.testing.assert_series_equal(processed_df['preprocessed_message'], expected_output)
+
+    def test_preprocess_dataframe_lone_surrogate(self):
+        # Test that text which cannot be UTF-8 encoded matches preprocess()
+        text = "ዋጋ\ud83d 300"
+        df = pd.DataFrame({'message': [text]})
+        processed_df = self.preprocessor.preprocess_dataframe(df, 'message', tokenize=True)
+
+        self.assertEqual(processed_df['preprocessed_message'][0], self.preprocessor.preprocess(text))
+        self.assertEqual(processed_df['preprocessed_message'][0], "ዋጋ 300")
+        self.assertEqual(processed_df['tokenized_message'][0], ["ዋጋ", "300"])
+
+    def test_preprocess_dataframe_non_string_column(self):
+        # Test that a column without any strings is treated as missing text
+        df = pd.DataFrame({'message': [np.nan, 300.0]})
+        processed_df = self.preprocessor.preprocess_dataframe(df, 'message')
+        self.assertTrue(processed_df['preprocessed_message'].isna().all())
+
+    def test_preprocess_dataframe_duplicates(self):
+        # Test that repeated messages and missing values keep their row positions
+        data = {'message': ["ዋጋ 300 ብር!", None, "ሰላም", "ዋጋ 300 ብር!"]}
+        df = pd.DataFrame(data, index=[3, 1, 2, 0])
+        processed_df = self.preprocessor.preprocess_dataframe(df, 'message')
+
+        expected_output = pd.Series(["ዋጋ 300 ብር", np.nan, "ሰላም", "ዋጋ 300 ብር"],
+                                    index=[3, 1, 2, 0], name="preprocessed_message")
+        pd.testing.assert_series_equal(processed_df['preprocessed_message'], expected_output)
+
+    def test_preprocess_dataframe_duplicates_own_token_lists(self):
+        # Test that editing the tokens of one row leaves its duplicates alone
+        df = pd.DataFrame({'message': ["ዋጋ 300 ብር", "ዋጋ 300 ብር"]})
+        processed_df = self.preprocessor.preprocess_dataframe(df, 'message', tokenize=True)
+
+        processed_df['tokenized_message'][0].append("ቦሌ")
+        self.assertEqual(processed_df['tokenized_message'][1], ["ዋጋ", "300", "ብር"])
+
+    def test_preprocess_dataframe_parallel(self):
+        # Test that sharding across worker processes gives the same result
+        data = {'message': ["ሰላም! ዋጋ 300 ብር.", "በአንድ ዋጋ", "", None, "Hello ቦሌ"]}
+        expected_df = self.preprocessor.preprocess_dataframe(pd.DataFrame(data), 'message', tokenize=True)
+        processed_df = self.preprocessor.preprocess_dataframe(pd.DataFrame(data), 'message',
+                                                              tokenize=True, n_jobs=2)
+        pd.testing.assert_frame_equal(processed_df, expected_df)
+
+    def test_preprocess_file(self):
+        # Test streaming a CSV through preprocessing in chunks into Parquet
+        data = {
+            'Channel Username': ['@a', '@a', '@b', '@b', '@c'],
+            'ID': [1, 2, 3, 4, 5],
+            'Message': ["ሰላም! ዋጋ 300 ብር.", None, "Hello", "በአንድ ዋጋ", "ሰላም! ዋጋ 300 ብር."],
+            'Media Path': [None, None, None, 'photo.jpg', None]
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = os.path.join(tmp_dir, 'messages.csv')
+            output_path = os.path.join(tmp_dir, 'messages.parquet')
+            pd.DataFrame(data).to_csv(input_path, index=False)
+
+            self.preprocessor.preprocess_file(input_path, output_path, 'Message',
+                                              chunksize=2, tokenize=True)
+            result = pd.read_parquet(output_path)
+
+        # Other columns keep their types; a column empty in the first chunk is text
+        self.assertEqual(result['ID'].tolist(), [1, 2, 3, 4, 5])
+        self.assertEqual(result['ID'].dtype, np.int64)
+        self.assertEqual(result['Media Path'].tolist(), [None, None, None, 'photo.jpg', None])
+        self.assertEqual(result['preprocessed_message'].tolist(),
+                         ["ሰላም ዋጋ 300 ብር", None, None, "በአንድ ዋጋ", "ሰላም ዋጋ 300 ብር"])
+        self.assertEqual(list(result['tokenized_message'][3]), ["በአንድ", "ዋጋ"])
+
 if __name__ == '__main__':
     unittest.main()